@@ -2,6 +2,7 @@ import movies
 import seating
 import bookings
 import storage
+import screens
 import reports
 
 def main():
@@ -14,6 +15,7 @@ def main():
     # Load initial data from storage
     showtimes, seat_maps, bookings_list = storage.load_state(base_dir)
     all_movies = movies.load_movies(f"{base_dir}movies.json")
+    screen_registry = screens.load_screens(f"{base_dir}screens.json")
 
     while True:
         print("\n=== MOVIE TICKET BOOKING SYSTEM ===")
@@ -25,7 +27,7 @@ def main():
         if choice == '1':
             customer_flow(showtimes, seat_maps, bookings_list, base_dir)
         elif choice == '2':
-            admin_flow(all_movies, showtimes, seat_maps, bookings_list, base_dir)
+            admin_flow(all_movies, screen_registry, showtimes, seat_maps, bookings_list, base_dir)
         elif choice == '3':
             # Save final state before closing
             storage.save_state(base_dir, showtimes, seat_maps, bookings_list)
@@ -73,7 +75,7 @@ def customer_flow(showtimes, seat_maps, bookings_list, base_dir):
                     "showtime_id": sid,
                     "seats": [seat_code],
                     "customer_email": email,
-                    "total_price": 100.0,
+                    "total_price": seat_maps[sid][seat_code]["price"],
                     "status": "Confirmed"
                 }
                 final_res = bookings.create_booking(showtimes, seat_maps, new_res)
@@ -95,17 +97,18 @@ def customer_flow(showtimes, seat_maps, bookings_list, base_dir):
         elif choice == '3':
             break
 
-def admin_flow(all_movies, showtimes, seat_maps, bookings_list, base_dir):
+def admin_flow(all_movies, screen_registry, showtimes, seat_maps, bookings_list, base_dir):
     """
-    Handles administrative tasks such as adding movies,
-    scheduling new showtimes, and viewing occupancy reports.
+    Handles administrative tasks such as adding movies, registering
+    screen layouts, scheduling new showtimes, and viewing occupancy reports.
     """
     while True:
         print("\n--- ADMIN MENU ---")
         print("1. Add Movie")
-        print("2. Schedule Showtime")
-        print("3. View Occupancy Report")
-        print("4. Back to Main Menu")
+        print("2. Add Screen Layout")
+        print("3. Schedule Showtime")
+        print("4. View Occupancy Report")
+        print("5. Back to Main Menu")
         choice = input("Select: ")
 
         if choice == '1':
@@ -116,6 +119,27 @@ def admin_flow(all_movies, showtimes, seat_maps, bookings_list, base_dir):
             print("Movie added.")
 
         elif choice == '2':
+            # Register the seat layout shared by every showtime on a screen
+            screen_name = input("Screen Name: ")
+            if screens.screen_in_use(showtimes, screen_name):
+                print("ERROR: Screen has scheduled showtimes; its layout cannot be changed.")
+                continue
+            try:
+                screen_config = {
+                    "rows": [r.strip().upper() for r in input("Row letters (e.g. A,B,C): ").split(",") if r.strip()],
+                    "cols": int(input("Seats per row: ")),
+                    "price": float(input("Seat price: "))
+                }
+            except ValueError:
+                print("ERROR: Seats per row and price must be numbers.")
+                continue
+            if not screens.register_screen(screen_registry, showtimes, screen_name, screen_config):
+                print("ERROR: Invalid layout. Rows must be single letters A-Z, with at least 1 seat per row and a non-negative price.")
+                continue
+            screens.save_screens(f"{base_dir}screens.json", screen_registry)
+            print("Screen layout saved.")
+
+        elif choice == '3':
             # Schedule a movie for a specific time and screen
             sid = input("Showtime ID: ")
             st_data = {
@@ -125,19 +149,22 @@ def admin_flow(all_movies, showtimes, seat_maps, bookings_list, base_dir):
                 "date": input("Date (YYYY-MM-DD): "),
                 "time": input("Time (HH:MM): ")
             }
+            if st_data["theatre_screen"] not in screen_registry:
+                print("ERROR: Unknown screen. Add its layout before scheduling showtimes on it.")
+                continue
             movies.schedule_showtime(showtimes, st_data)
-            # Initialize a fresh seat map for the new showtime
-            seat_maps[sid] = seating.initialize_seat_map({"rows": ["A", "B", "C"], "cols": 10})
+            # Initialize a fresh seat map backed by the screen's shared layout
+            seat_maps[sid] = screens.create_seat_map(screen_registry, st_data["theatre_screen"])
             storage.save_state(base_dir, showtimes, seat_maps, bookings_list)
             print("Showtime scheduled.")
 
-        elif choice == '3':
+        elif choice == '4':
             # Generate and display a report of current seat occupancy
             report = reports.occupancy_report(showtimes, seat_maps, bookings_list)
             for sid, data in report.items():
                 print(f"Show {sid}: {data['occupancy_rate']} full ({data['sold']}/{data['total']} seats)")
 
-        elif choice == '4':
+        elif choice == '5':
             break
 
 if __name__ == "__main__":
@@ -0,0 +1,123 @@
+import json
+import os
+import seating
+
+def load_screens(path: str) -> dict:
+    """
+    Loads the screen layout registry from a JSON file.
+    Returns an empty registry if the file does not exist. Entries that fail
+    validation are skipped, so their showtimes use the default layout.
+
+    Args:
+        path (str): The file path to the screens JSON file.
+
+    Returns:
+        dict: A dictionary mapping theatre_screen names to their layout configuration.
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as file:
+        screens = json.load(file)
+    return {name: config for name, config in screens.items() if validate_screen_config(config)}
+
+def save_screens(path: str, screens: dict) -> None:
+    """
+    Saves the screen layout registry to a JSON file.
+
+    Args:
+        path (str): The file path where the registry should be saved.
+        screens (dict): The registry of screen layout configurations.
+    """
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(screens, file, indent=4)
+
+def validate_screen_config(screen_config: dict) -> bool:
+    """
+    Validates that a screen configuration describes a usable seat layout.
+    Rows must be single uppercase letters so seat codes stay parseable.
+
+    Args:
+        screen_config (dict): Configuration containing "rows", "cols" and "price".
+
+    Returns:
+        bool: True if there is at least one valid row, cols >= 1 and price >= 0.
+    """
+    if not isinstance(screen_config, dict):
+        return False
+    rows = screen_config.get("rows")
+    cols = screen_config.get("cols")
+    price = screen_config.get("price")
+    if not isinstance(rows, list) or not rows or len(set(rows)) != len(rows):
+        return False
+    if not all(isinstance(r, str) and len(r) == 1 and "A" <= r <= "Z" for r in rows):
+        return False
+    if not isinstance(cols, int) or isinstance(cols, bool) or cols < 1:
+        return False
+    return isinstance(price, (int, float)) and not isinstance(price, bool) and price >= 0
+
+def screen_in_use(showtimes: list, screen_name: str) -> bool:
+    """
+    Checks whether any showtime is scheduled on the given screen.
+
+    Args:
+        showtimes (list): The list of current showtimes.
+        screen_name (str): The theatre_screen name to look for.
+
+    Returns:
+        bool: True if at least one showtime uses the screen, False otherwise.
+    """
+    return any(s.get("theatre_screen") == screen_name for s in showtimes)
+
+def register_screen(screens: dict, showtimes: list, screen_name: str, screen_config: dict) -> dict:
+    """
+    Adds or replaces the layout configuration of a screen in the registry.
+    Screens that already have scheduled showtimes cannot be changed, since
+    their seat maps and bookings depend on the current layout.
+
+    Args:
+        screens (dict): The registry of screen layout configurations.
+        showtimes (list): The list of current showtimes.
+        screen_name (str): The theatre_screen name (e.g., 'Screen 1').
+        screen_config (dict): Configuration containing "rows", "cols" and "price".
+
+    Returns:
+        dict: The registered screen configuration, or an empty dict if the
+              configuration is invalid or the screen is in use.
+    """
+    if not validate_screen_config(screen_config) or screen_in_use(showtimes, screen_name):
+        return {}
+    screens[screen_name] = screen_config
+    return screen_config
+
+def get_layout(screens: dict, screen_name: str):
+    """
+    Resolves the shared seat layout for a screen.
+    Screens missing from the registry fall back to the default configuration.
+
+    Args:
+        screens (dict): The registry of screen layout configurations.
+        screen_name (str): The theatre_screen name of a showtime.
+
+    Returns:
+        Mapping: The immutable seat layout shared by all showtimes on the screen.
+    """
+    return seating.build_layout(screens.get(screen_name, seating.DEFAULT_SCREEN_CONFIG))
+
+def create_seat_map(screens: dict, screen_name: str, statuses: dict = None) -> seating.SeatMap:
+    """
+    Creates a seat map for a showtime on the given screen.
+
+    Args:
+        screens (dict): The registry of screen layout configurations.
+        screen_name (str): The theatre_screen name of the showtime.
+        statuses (dict, optional): Initial non-available seat statuses. Seats that
+                                   are not part of the layout are ignored. They are
+                                   not recorded in the change feed.
+
+    Returns:
+        SeatMap: A seat map backed by the shared layout.
+    """
+    layout = get_layout(screens, screen_name)
+    return seating.SeatMap(layout, {
+        seat: status for seat, status in (statuses or {}).items() if seat in layout
+    })
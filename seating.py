@@ -1,22 +1,238 @@
-def initialize_seat_map(screen_config: dict) -> dict:
+from collections import deque
+from collections.abc import Callable, Mapping, MutableMapping
+from functools import lru_cache
+from types import MappingProxyType
+import uuid
+
+DEFAULT_SCREEN_CONFIG = {"rows": ["A", "B", "C", "D"], "cols": 10, "price": 100.0}
+
+
+@lru_cache(maxsize=None)
+def _build_layout(rows: tuple, cols: int, price: float) -> Mapping:
+    seat_template = MappingProxyType({"price": price})
+    return MappingProxyType({
+        f"{row}{col}": seat_template for row in rows for col in range(1, cols + 1)
+    })
+
+
+def build_layout(screen_config: dict) -> Mapping:
     """
-    Creates a new seat map based on the provided screen dimensions and row labels.
+    Returns the shared, read-only seat template for a screen configuration.
+    Identical configurations always resolve to the same layout object, so every
+    showtime on a screen references one copy of its seats.
 
     Args:
-        screen_config (dict): Configuration containing "rows" (list of letters)
-                             and "cols" (integer number of columns).
+        screen_config (dict): Configuration containing "rows" (list of letters),
+                             "cols" (integer number of columns) and "price".
 
     Returns:
-        dict: A dictionary mapping seat codes (e.g., 'A1') to their status and price multiplier.
+        Mapping: An immutable mapping of seat codes (e.g., 'A1') to their template.
     """
-    rows = screen_config.get("rows", ["A", "B", "C", "D", "E", "F", "G", "H"])
-    cols = screen_config.get("cols", 12)
-    seat_map = {}
-    for row in rows:
-        for col in range(1, cols + 1):
-            seat_code = f"{row}{col}"
-            seat_map[seat_code] = {"status": "available", "price_multiplier": 1.0}
-    return seat_map
+    rows = tuple(screen_config.get("rows", DEFAULT_SCREEN_CONFIG["rows"]))
+    cols = int(screen_config.get("cols", DEFAULT_SCREEN_CONFIG["cols"]))
+    price = float(screen_config.get("price", DEFAULT_SCREEN_CONFIG["price"]))
+    return _build_layout(rows, cols, price)
+
+
+class _SeatView(MutableMapping):
+    """Dictionary-like view of one seat, combining its template with its status."""
+
+    __slots__ = ("_seat_map", "_code")
+
+    def __init__(self, seat_map: "SeatMap", code: str):
+        self._seat_map = seat_map
+        self._code = code
+
+    def __getitem__(self, key):
+        if key == "status":
+            return self._seat_map.statuses.get(self._code, "available")
+        return self._seat_map.layout[self._code][key]
+
+    def __setitem__(self, key, value):
+        if key != "status":
+            raise KeyError(f"Seat field '{key}' is defined by the screen layout and is read-only.")
+        previous = self["status"]
+        if value == "available":
+            self._seat_map.statuses.pop(self._code, None)
+        else:
+            self._seat_map.statuses[self._code] = value
+        if previous != value:
+            self._seat_map.feed.record(self._code, previous, value)
+
+    def __delitem__(self, key):
+        raise KeyError(f"Seat field '{key}' cannot be removed.")
+
+    def __iter__(self):
+        yield "status"
+        yield from self._seat_map.layout[self._code]
+
+    def __len__(self):
+        return len(self._seat_map.layout[self._code]) + 1
+
+
+class SeatChangeFeed:
+    """
+    Monotonically versioned log of seat status transitions for one showtime.
+    Only the most recent transitions are retained; viewers that fall further
+    behind must re-render the full seat map. Versions restart with every new
+    feed, so each feed carries a unique epoch that viewers send back when polling.
+
+    Args:
+        max_entries (int): The number of most recent transitions to keep. Default is 1000.
+    """
+
+    def __init__(self, max_entries: int = 1000):
+        self.epoch = str(uuid.uuid4())
+        self.version = 0
+        self.entries = deque(maxlen=max_entries)
+        self.subscribers = []
+        self.failed_subscribers = []
+
+    def record(self, seat_code: str, previous: str, status: str) -> dict:
+        """
+        Appends a seat status transition and notifies every subscriber.
+        A subscriber that raises cannot interrupt the seat update or the other
+        subscribers; it is unsubscribed and kept with its error in
+        failed_subscribers.
+
+        Args:
+            seat_code (str): The seat whose status changed (e.g., 'A1').
+            previous (str): The status before the change.
+            status (str): The status after the change.
+
+        Returns:
+            dict: The recorded change with its "version", "seat", "from" and "to".
+        """
+        self.version += 1
+        change = {"version": self.version, "seat": seat_code, "from": previous, "to": status}
+        self.entries.append(change)
+        for callback in list(self.subscribers):
+            try:
+                callback(change)
+            except Exception as error:
+                self.subscribers.remove(callback)
+                self.failed_subscribers.append((callback, error))
+        return change
+
+    def since(self, version: int) -> list | None:
+        """
+        Returns the transitions recorded after a given version.
+
+        Args:
+            version (int): The last version the viewer has already applied.
+
+        Returns:
+            list | None: The changes after version, or None if they are no longer
+                         retained or the version is unknown to this feed (negative,
+                         or ahead of it, e.g. after a restart).
+        """
+        if version == self.version:
+            return []
+        if version < 0 or version > self.version:
+            return None
+        oldest = self.entries[0]["version"] if self.entries else self.version + 1
+        if version < oldest - 1:
+            return None
+        changes = []
+        for change in reversed(self.entries):
+            if change["version"] <= version:
+                break
+            changes.append(change)
+        changes.reverse()
+        return changes
+
+
+class SeatMap(Mapping):
+    """
+    Seat map for a single showtime. The seat layout is shared with every other
+    showtime on the same screen; only seats whose status differs from
+    'available' are stored per showtime. Every status transition is
+    appended to the map's change feed.
+    """
+
+    __slots__ = ("layout", "statuses", "feed")
+
+    def __init__(self, layout: Mapping, statuses: dict = None):
+        self.layout = layout
+        self.statuses = dict(statuses or {})
+        self.feed = SeatChangeFeed()
+
+    def __getitem__(self, seat_code):
+        if seat_code not in self.layout:
+            raise KeyError(seat_code)
+        return _SeatView(self, seat_code)
+
+    def __contains__(self, seat_code):
+        return seat_code in self.layout
+
+    def __iter__(self):
+        return iter(self.layout)
+
+    def __len__(self):
+        return len(self.layout)
+
+
+def export_seat_map(seat_map: Mapping) -> dict:
+    """
+    Produces a compact, JSON-serializable snapshot of a seat map that only
+    records seats whose status is not 'available'.
+
+    Args:
+        seat_map (Mapping): The seat layout for a specific showtime.
+
+    Returns:
+        dict: A dictionary mapping seat codes to their non-available status.
+    """
+    if isinstance(seat_map, SeatMap):
+        return dict(seat_map.statuses)
+    return {
+        code: seat["status"] for code, seat in seat_map.items() if seat["status"] != "available"
+    }
+
+def subscribe(seat_map: SeatMap, callback: Callable[[dict], None]) -> Callable[[], None]:
+    """
+    Registers a callback that receives every seat status transition of a showtime.
+
+    Args:
+        seat_map (SeatMap): The seat map of the showtime to follow.
+        callback (Callable): Called with a change dict containing "version",
+                             "seat", "from" and "to" for each transition.
+
+    Returns:
+        Callable: A function that removes the subscription when called.
+    """
+    seat_map.feed.subscribers.append(callback)
+
+    def unsubscribe():
+        if callback in seat_map.feed.subscribers:
+            seat_map.feed.subscribers.remove(callback)
+
+    return unsubscribe
+
+def poll_changes(seat_map: Mapping, since_version: int, epoch: str | None = None) -> dict:
+    """
+    Returns the seat status transitions recorded after a given version.
+
+    Args:
+        seat_map (Mapping): The seat map of a specific showtime.
+        since_version (int): The last version the viewer has already applied.
+        epoch (str, optional): The feed epoch returned by the viewer's previous poll.
+
+    Returns:
+        dict: The feed's "epoch" and current "version", the list of "changes"
+              after since_version, and "reset", which is True when the epoch does
+              not match, the deltas are no longer available or since_version is not
+              a version of this feed. On reset the viewer must re-render the full
+              seat map and continue from the returned epoch and version.
+    """
+    feed = getattr(seat_map, "feed", None)
+    changes = feed.since(since_version) if feed and epoch == feed.epoch else None
+    return {
+        "epoch": feed.epoch if feed else None,
+        "version": feed.version if feed else 0,
+        "changes": changes or [],
+        "reset": changes is None
+    }
 
 def render_seat_map(seat_map: dict) -> str:
     """
@@ -2,11 +2,14 @@ import json
 import os
 import shutil
 from datetime import datetime
+import screens
+import seating
 
 def load_state(base_dir: str) -> tuple:
     """
     Initializes the system state by loading showtimes and bookings from JSON files.
     Dynamically reconstructs seat maps by marking seats as 'sold' based on existing bookings.
+    Seat maps share the layout of their theatre_screen from the screen registry.
 
     Args:
         base_dir (str): The directory where data files are stored.
@@ -16,6 +19,7 @@ def load_state(base_dir: str) -> tuple:
     """
     showtimes_path = os.path.join(base_dir, 'showtimes.json')
     bookings_path = os.path.join(base_dir, 'bookings.json')
+    screen_registry = screens.load_screens(os.path.join(base_dir, 'screens.json'))
 
     showtimes = []
     if os.path.exists(showtimes_path):
@@ -27,20 +31,15 @@ def load_state(base_dir: str) -> tuple:
         with open(bookings_path, 'r', encoding='utf-8') as f:
             bookings_list = json.load(f)
 
+    sold_seats = {}
+    for b in bookings_list:
+        for seat in b['seats']:
+            sold_seats.setdefault(b['showtime_id'], {})[seat] = "sold"
+
     seat_maps = {}
     for s in showtimes:
         sid = s['showtime_id']
-        seat_maps[sid] = {
-            f"{r}{c}": {"status": "available", "price": 100.0}
-            for r in ["A", "B", "C", "D"] for c in range(1, 11)
-        }
-
-    for b in bookings_list:
-        sid = b['showtime_id']
-        if sid in seat_maps:
-            for seat in b['seats']:
-                if seat in seat_maps[sid]:
-                    seat_maps[sid][seat]["status"] = "sold"
+        seat_maps[sid] = screens.create_seat_map(screen_registry, s.get('theatre_screen'), sold_seats.get(sid))
 
     return showtimes, seat_maps, bookings_list
 
@@ -52,7 +51,8 @@ def save_state(base_dir: str, showtimes: list, seat_maps: dict, bookings: list)
     Args:
         base_dir (str): The target directory for saving data.
         showtimes (list): The list of current showtimes.
-        seat_maps (dict): The current seat layouts and statuses.
+        seat_maps (dict): The current seat layouts and statuses. Only seats that are
+                          not 'available' are written to disk.
         bookings (list): The list of all processed bookings.
     """
     if not os.path.exists(base_dir):
@@ -60,7 +60,7 @@ def save_state(base_dir: str, showtimes: list, seat_maps: dict, bookings: list)
 
     files_data = {
         'showtimes.json': showtimes,
-        'seat_maps.json': seat_maps,
+        'seat_maps.json': {sid: seating.export_seat_map(m) for sid, m in seat_maps.items()},
         'bookings.json': bookings
     }
 
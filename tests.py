@@ -1,8 +1,10 @@
 import unittest
 import os
 import json
+import storage
 import seating
 import bookings
+import screens
 
 
 class TestCinemaSystem(unittest.TestCase):
@@ -51,6 +53,151 @@ class TestCinemaSystem(unittest.TestCase):
         self.assertEqual(len(self.bookings), 0)
         self.assertEqual(self.seat_maps["ST_001"]["A2"]["status"], "available")
 
+    def test_screen_layout_shared_across_showtimes(self):
+        registry = {"Screen 1": {"rows": ["A", "B"], "cols": 5, "price": 80.0}}
+        first = screens.create_seat_map(registry, "Screen 1")
+        second = screens.create_seat_map(registry, "Screen 1")
+
+        self.assertIs(first.layout, second.layout)
+        self.assertEqual(len(first), 10)
+        self.assertEqual(first["B5"]["price"], 80.0)
+
+        first["A1"]["status"] = "sold"
+        self.assertFalse(seating.is_seat_available(first, "A1"))
+        self.assertTrue(seating.is_seat_available(second, "A1"))
+        self.assertEqual(seating.export_seat_map(first), {"A1": "sold"})
+
+        seating.release_seat(first, "A1")
+        self.assertEqual(first.statuses, {})
+
+    def test_seat_change_feed(self):
+        registry = {}
+        seat_maps = {"ST_002": screens.create_seat_map(registry, "Screen 9")}
+        seat_map = seat_maps["ST_002"]
+        received = []
+        unsubscribe = seating.subscribe(seat_map, received.append)
+
+        seating.reserve_seat(seat_map, "A1")
+        booking = bookings.create_booking([], seat_maps, {"showtime_id": "ST_002", "seats": ["A1", "A2"]})
+        start = seating.poll_changes(seat_map, 0, seat_map.feed.epoch)
+        self.assertEqual(start["version"], 3)
+        self.assertEqual([(c["seat"], c["from"], c["to"]) for c in start["changes"]],
+                         [("A1", "available", "reserved"), ("A1", "reserved", "sold"), ("A2", "available", "sold")])
+        self.assertEqual(received, start["changes"])
+
+        unsubscribe()
+        bookings.cancel_booking([booking], booking["booking_id"], seat_maps)
+        delta = seating.poll_changes(seat_map, start["version"], seat_map.feed.epoch)
+        self.assertFalse(delta["reset"])
+        self.assertEqual([c["to"] for c in delta["changes"]], ["available", "available"])
+        self.assertEqual(len(received), 3)
+        self.assertEqual(seating.poll_changes(seat_map, delta["version"], seat_map.feed.epoch)["changes"], [])
+
+    def test_seat_change_feed_requires_reset_when_trimmed(self):
+        seat_map = screens.create_seat_map({}, "Screen 9")
+        seat_map.feed = seating.SeatChangeFeed(max_entries=2)
+        for code in ["A1", "A2", "A3"]:
+            seating.reserve_seat(seat_map, code)
+
+        self.assertTrue(seating.poll_changes(seat_map, 0, seat_map.feed.epoch)["reset"])
+        self.assertEqual(len(seating.poll_changes(seat_map, 1, seat_map.feed.epoch)["changes"]), 2)
+
+    def test_register_screen_validation(self):
+        registry = {}
+        showtimes = [{"showtime_id": "ST_001", "theatre_screen": "Screen 1"}]
+
+        self.assertEqual(screens.register_screen(registry, showtimes, "Screen 2", {"rows": ["AA"], "cols": 5, "price": 50.0}), {})
+        self.assertEqual(screens.register_screen(registry, showtimes, "Screen 2", {"rows": [], "cols": 5, "price": 50.0}), {})
+        self.assertEqual(screens.register_screen(registry, showtimes, "Screen 2", {"rows": ["A"], "cols": 0, "price": 50.0}), {})
+        self.assertEqual(screens.register_screen(registry, showtimes, "Screen 2", {"rows": ["A"], "cols": 5, "price": -1.0}), {})
+        self.assertEqual(screens.register_screen(registry, showtimes, "Screen 1", {"rows": ["A"], "cols": 5, "price": 50.0}), {})
+        self.assertEqual(registry, {})
+
+        config = {"rows": ["A", "B"], "cols": 5, "price": 50.0}
+        self.assertEqual(screens.register_screen(registry, showtimes, "Screen 2", config), config)
+        self.assertEqual(registry, {"Screen 2": config})
+
+    def test_load_screens_skips_invalid_entries(self):
+        path = os.path.join(self.test_dir, 'screens.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "Screen 1": {"rows": ["A"], "cols": 4, "price": 90.0},
+                "Screen 2": {"rows": ["AA"], "cols": "x"},
+                "Screen 3": "broken"
+            }, f)
+
+        registry = screens.load_screens(path)
+
+        self.assertEqual(list(registry), ["Screen 1"])
+        self.assertEqual(len(screens.create_seat_map(registry, "Screen 2")), 40)
+
+    def test_load_state_uses_screen_registry(self):
+        with open(os.path.join(self.test_dir, 'screens.json'), 'w', encoding='utf-8') as f:
+            json.dump({"Screen 1": {"rows": ["A", "B"], "cols": 6, "price": 75.0}}, f)
+        with open(os.path.join(self.test_dir, 'showtimes.json'), 'w', encoding='utf-8') as f:
+            json.dump([
+                {"showtime_id": "ST_001", "theatre_screen": "Screen 1"},
+                {"showtime_id": "ST_002", "theatre_screen": "Screen 1"}
+            ], f)
+        with open(os.path.join(self.test_dir, 'bookings.json'), 'w', encoding='utf-8') as f:
+            json.dump(self.bookings, f)
+
+        _, seat_maps, _ = storage.load_state(self.test_dir)
+
+        self.assertEqual(len(seat_maps["ST_001"]), 12)
+        self.assertEqual(seat_maps["ST_001"]["B6"]["price"], 75.0)
+        self.assertEqual(seat_maps["ST_001"]["A2"]["status"], "sold")
+        self.assertEqual(seating.export_seat_map(seat_maps["ST_001"]), {"A2": "sold"})
+        self.assertEqual(seating.export_seat_map(seat_maps["ST_002"]), {})
+        self.assertIs(seat_maps["ST_001"].layout, seat_maps["ST_002"].layout)
+
+    def test_seat_change_feed_resets_unknown_version(self):
+        seat_map = screens.create_seat_map({}, "Screen 9")
+        for code in ["A1", "A2", "A3"]:
+            seating.reserve_seat(seat_map, code)
+
+        future = seating.poll_changes(seat_map, 50, seat_map.feed.epoch)
+        self.assertTrue(future["reset"])
+        self.assertEqual(future["version"], 3)
+        self.assertTrue(seating.poll_changes(seat_map, -1, seat_map.feed.epoch)["reset"])
+        self.assertFalse(seating.poll_changes(seat_map, 3, seat_map.feed.epoch)["reset"])
+
+    def test_seat_change_feed_resets_after_reload(self):
+        with open(os.path.join(self.test_dir, 'showtimes.json'), 'w', encoding='utf-8') as f:
+            json.dump([{"showtime_id": "ST_001", "theatre_screen": "Screen 1"}], f)
+        showtimes, seat_maps, bookings_list = storage.load_state(self.test_dir)
+        seat_map = seat_maps["ST_001"]
+        seating.reserve_seat(seat_map, "A1")
+        viewer = seating.poll_changes(seat_map, 0, seat_map.feed.epoch)
+
+        bookings_list.append(bookings.create_booking(showtimes, seat_maps, {"showtime_id": "ST_001", "seats": ["A1"]}))
+        storage.save_state(self.test_dir, showtimes, seat_maps, bookings_list)
+        _, reloaded, _ = storage.load_state(self.test_dir)
+
+        self.assertEqual(reloaded["ST_001"].feed.version, 0)
+        self.assertEqual(reloaded["ST_001"]["A1"]["status"], "sold")
+        poll = seating.poll_changes(reloaded["ST_001"], viewer["version"], viewer["epoch"])
+        self.assertTrue(poll["reset"])
+        self.assertEqual(poll["epoch"], reloaded["ST_001"].feed.epoch)
+
+    def test_failing_subscriber_does_not_stop_booking(self):
+        seat_maps = {"ST_002": screens.create_seat_map({}, "Screen 9")}
+        received = []
+
+        def broken(change):
+            raise RuntimeError("viewer disconnected")
+
+        seating.subscribe(seat_maps["ST_002"], broken)
+        seating.subscribe(seat_maps["ST_002"], received.append)
+        booking = bookings.create_booking([], seat_maps, {"showtime_id": "ST_002", "seats": ["B1", "B2"]})
+
+        self.assertIn("booking_id", booking)
+        self.assertEqual(seating.export_seat_map(seat_maps["ST_002"]), {"B1": "sold", "B2": "sold"})
+        self.assertEqual([c["seat"] for c in received], ["B1", "B2"])
+        self.assertEqual(seat_maps["ST_002"].feed.subscribers, [received.append])
+        self.assertEqual(len(seat_maps["ST_002"].feed.failed_subscribers), 1)
+        self.assertIs(seat_maps["ST_002"].feed.failed_subscribers[0][0], broken)
+
     def tearDown(self):
         if os.path.exists(self.test_dir):
             for file in os.listdir(self.test_dir):